@@ -1,12 +1,18 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from openai import OpenAI
+from openai import AsyncOpenAI
 
+import asyncio
+import hmac
+import json
 import os
 import sys
+import time
 import uuid
+from collections import OrderedDict
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
 
 # Make execlayer_kernel importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +27,8 @@ from execlayer_kernel.rules import (
     RuleEscalateCrossBorderSensitiveUpload,
 )
 from execlayer_kernel.constants import DataClass, safe_parse_data_class
+from execlayer_kernel.blobstore import BlobStore
+from execlayer_kernel.stream import DecisionStream, StreamLagged
 
 
 MODE = os.getenv("EXECLAYER_MODE", "demo")
@@ -60,17 +68,116 @@ bundle = PolicyBundle(
     ],
 )
 
+decision_stream = DecisionStream(
+    capacity=int(os.getenv("EXECLAYER_STREAM_CAPACITY", "4096")),
+    max_bytes=int(os.getenv("EXECLAYER_STREAM_MAX_BYTES", str(64 * 1024 * 1024))),
+)
+
+BLOB_DIR = os.getenv("EXECLAYER_BLOB_DIR")
+blob_store = (
+    BlobStore(BLOB_DIR, int(os.getenv("EXECLAYER_BLOB_THRESHOLD_CHARS", "65536")))
+    if BLOB_DIR
+    else None
+)
+
 kernel = ExecLayerKernel(
     policy_bundle=bundle,
     audit_log_path="/tmp/execlayer_audit.log.jsonl",
     signing_secret=os.getenv("SIGNING_SECRET", "dev_secret_change_me").encode(),
+    signing_key_id=os.getenv("SIGNING_KEY_ID", "default"),
     mode=MODE,
+    capture_replay=os.getenv("EXECLAYER_CAPTURE_REPLAY", "0") == "1",
+    decision_stream=decision_stream,
+    blob_store=blob_store,
 )
 
 # --- OpenAI client for the governance agent ---------------------------------
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
+AGENT_MODEL = os.getenv("EXECLAYER_AGENT_MODEL", "gpt-4.1-mini")
+AGENT_MAX_CONCURRENCY = int(os.getenv("EXECLAYER_AGENT_MAX_CONCURRENCY", "8"))
+AGENT_CACHE_TTL_S = float(os.getenv("EXECLAYER_AGENT_CACHE_TTL_S", "300"))
+AGENT_CACHE_MAX_ENTRIES = int(os.getenv("EXECLAYER_AGENT_CACHE_MAX_ENTRIES", "1024"))
+
+# Async client so in-flight completions never block /intercept traffic.
+# OPENAI_BASE_URL is honoured by the client, which lets tests point it at a
+# local stand-in server.
+client = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+agent_slots = asyncio.Semaphore(AGENT_MAX_CONCURRENCY)
+
+AGENT_SYSTEM_PROMPT = (
+    "You are the ExecLayer Kernel AI Governance Agent. "
+    "You sit between agent intent and system action. "
+    "You give concrete AI governance and risk management guidance, "
+    "grounded in zero‑trust, execution‑layer controls, receipts/forensics, "
+    "and mappings to frameworks like IAPP AIGP BoK 2.1. "
+    "Prefer specific controls and operational steps over vague policy talk. "
+    "If you don't know or lack information, say so plainly."
+)
+
+AgentCacheKey = Tuple[str, str]
+
+
+def _normalize_agent_text(text: Optional[str]) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+class AgentResponseCache:
+    """Bounded TTL cache with single-flight coalescing of identical questions."""
+
+    def __init__(self, ttl_s: float, max_entries: int):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[AgentCacheKey, Tuple[float, str]]" = OrderedDict()
+        self._inflight: Dict[AgentCacheKey, "asyncio.Future[str]"] = {}
+
+    @staticmethod
+    def key_for(question: str, context: Optional[str]) -> AgentCacheKey:
+        return _normalize_agent_text(question), _normalize_agent_text(context)
+
+    def get(self, key: AgentCacheKey) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, answer = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return answer
+
+    def put(self, key: AgentCacheKey, answer: str) -> None:
+        if self.max_entries <= 0 or self.ttl_s <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl_s, answer)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_compute(
+        self, key: AgentCacheKey, compute: Callable[[], Awaitable[str]]
+    ) -> str:
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(compute())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._settle(key, t))
+
+        # Shielded so one caller disconnecting does not cancel the shared call.
+        return await asyncio.shield(task)
+
+    def _settle(self, key: AgentCacheKey, task: "asyncio.Future[str]") -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.put(key, task.result())
+
+
+agent_cache = AgentResponseCache(AGENT_CACHE_TTL_S, AGENT_CACHE_MAX_ENTRIES)
 
 
 class AgentRequest(BaseModel):
@@ -185,43 +292,152 @@ async def demo():
     }
 
 
+# --- Live decision stream (SSE) ---------------------------------------------
+
+
+STREAM_HEARTBEAT_S = 15.0
+
+
+def _sse(event: str, data: str, event_id: Optional[str] = None) -> str:
+    frame = f"event: {event}\n"
+    if event_id:
+        frame += f"id: {event_id}\n"
+    return frame + f"data: {data}\n\n"
+
+
+@app.get("/stream/decisions")
+async def stream_decisions(
+    request: Request,
+    verdict: Optional[str] = None,
+    tool: Optional[str] = None,
+    agent: Optional[str] = None,
+    after: Optional[str] = None,
+):
+    # Resume cursor: explicit ?after=<entry_hash> or the SSE Last-Event-ID header.
+    after = after or request.headers.get("last-event-id")
+    cursor = None
+    if after:
+        cursor = decision_stream.cursor_after(after)
+        if cursor is None:
+            raise HTTPException(
+                status_code=410,
+                detail="entry_hash is no longer retained in the stream buffer; re-read the audit log.",
+            )
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for item in decision_stream.subscribe(
+                cursor=cursor,
+                verdict=verdict.upper() if verdict else None,
+                tool=tool,
+                agent=agent,
+                heartbeat_s=STREAM_HEARTBEAT_S,
+            ):
+                if item is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                # The stored audit line is sent as-is; it is never re-parsed here.
+                yield _sse(item.event or "decision", item.line, item.entry_hash)
+        except StreamLagged as e:
+            # Slow consumers are cut off rather than allowed to hold the kernel.
+            yield _sse("lagged", json.dumps({"error": str(e)}))
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# --- Signing key administration --------------------------------------------
+
+
+# Unset disables the admin routes entirely (they answer 404).
+ADMIN_TOKEN = os.getenv("EXECLAYER_ADMIN_TOKEN")
+
+
+class SigningKeyRotation(BaseModel):
+    kid: str
+    secret: str
+
+
+class SigningKeyRetirement(BaseModel):
+    kid: str
+
+
+def _require_admin(request: Request) -> None:
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token.")
+
+
+def _signing_keys() -> Dict[str, object]:
+    return {"active_kid": kernel.keyring.active_kid, "kids": kernel.keyring.kids()}
+
+
+@app.get("/admin/signing-keys")
+async def list_signing_keys(request: Request):
+    _require_admin(request)
+    return _signing_keys()
+
+
+@app.post("/admin/signing-keys/rotate")
+async def rotate_signing_key(request: Request, payload: SigningKeyRotation):
+    # New receipts are signed with the new key at once; old ones still verify.
+    _require_admin(request)
+    if not payload.kid or not payload.secret:
+        raise HTTPException(status_code=422, detail="kid and secret must be non-empty.")
+    try:
+        kernel.rotate_signing_key(payload.kid, payload.secret.encode())
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _signing_keys()
+
+
+@app.post("/admin/signing-keys/retire")
+async def retire_signing_key(request: Request, payload: SigningKeyRetirement):
+    _require_admin(request)
+    try:
+        kernel.retire_signing_key(payload.kid)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return _signing_keys()
+
+
 # --- NEW: ExecLayer governance agent ----------------------------------------
 
 
 @app.post("/agent", response_model=AgentResponse)
 async def exec_layer_agent(payload: AgentRequest) -> AgentResponse:
-    if not OPENAI_API_KEY:
+    if client is None:
         raise HTTPException(
             status_code=500,
             detail="OPENAI_API_KEY is not set in the environment.",
         )
 
-    system_prompt = (
-        "You are the ExecLayer Kernel AI Governance Agent. "
-        "You sit between agent intent and system action. "
-        "You give concrete AI governance and risk management guidance, "
-        "grounded in zero‑trust, execution‑layer controls, receipts/forensics, "
-        "and mappings to frameworks like IAPP AIGP BoK 2.1. "
-        "Prefer specific controls and operational steps over vague policy talk. "
-        "If you don't know or lack information, say so plainly."
-    )
-
     user_content = payload.question
     if payload.context:
         user_content += f"\n\nAdditional context: {payload.context}"
 
+    async def ask() -> str:
+        async with agent_slots:
+            completion = await client.chat.completions.create(
+                model=AGENT_MODEL,
+                messages=[
+                    {"role": "system", "content": AGENT_SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content},
+                ],
+            )
+        return (completion.choices[0].message.content or "").strip()
+
+    key = AgentResponseCache.key_for(payload.question, payload.context)
     try:
-        completion = client.chat.completions.create(
-            model="gpt-4.1-mini",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_content},
-            ],
-        )
+        answer = await agent_cache.get_or_compute(key, ask)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"OpenAI error: {e}")
 
-    answer = completion.choices[0].message.content.strip()
     return AgentResponse(answer=answer, reasoning=None)
 
 
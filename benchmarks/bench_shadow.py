@@ -0,0 +1,80 @@
+"""p50/p99 of ExecLayerKernel.intercept with shadow evaluation off and on.
+
+Usage: python benchmarks/bench_shadow.py [calls]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execlayer_kernel.constants import DataClass
+from execlayer_kernel.context import Actor, ExecutionContext, Intent
+from execlayer_kernel.kernel import ExecLayerKernel
+from execlayer_kernel.policy_bundle import PolicyBundle, PolicyRule
+from execlayer_kernel.rules import RuleBlockSelfPromptRewrite, RuleBlockSlackSecretScrape
+
+class RuleSpin(PolicyRule):
+    """CPU-bound candidate rule: the worst case for a shadow worker."""
+
+    def evaluate(self, ctx, tool_name, params):
+        total = 0
+        for i in range(200000):
+            total += i
+        return None
+
+ACTIVE = PolicyBundle(
+    bundle_id="active",
+    version="1",
+    rules=[RuleBlockSelfPromptRewrite(rule_id="R-AGENT-001", priority=100, description="")]
+)
+CANDIDATES = {
+    "shadow off": None,
+    "shadow on (shipped rules)": PolicyBundle(
+        bundle_id="candidate",
+        version="2",
+        rules=[RuleBlockSlackSecretScrape(rule_id="R-SECR-002", priority=90, description="")]
+    ),
+    "shadow on (CPU-bound rule)": PolicyBundle(
+        bundle_id="spin",
+        version="2",
+        rules=[RuleSpin(rule_id="R-SPIN", priority=1, description="")]
+    ),
+}
+CTX = ExecutionContext(
+    actor=Actor(id="u", display="U", org_unit="o", role="r"),
+    agent_id="bench",
+    session_id="s",
+    intent=Intent(statement="i", purpose="p", business_process="b"),
+    environment="bench",
+    jurisdiction="US",
+    data_class=DataClass.INTERNAL,
+    attributes={}
+)
+CALL = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "api_key"}}
+
+def percentiles(samples):
+    ordered = sorted(samples)
+    return statistics.median(ordered), ordered[int(len(ordered) * 0.99) - 1]
+
+def measure(kernel, n):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        kernel.intercept(CTX, CALL)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+def main(n: int) -> None:
+    with tempfile.TemporaryDirectory() as d:
+        for label, candidate in CANDIDATES.items():
+            kernel = ExecLayerKernel(ACTIVE, os.path.join(d, "audit.jsonl"), shadow_bundle=candidate)
+            time.sleep(1.0)  # let workers start
+            p50, p99 = measure(kernel, n)
+            kernel.disable_shadow()
+            print(f"{label:<30} p50 {p50 * 1e6:8.1f} us   p99 {p99 * 1e6:8.1f} us")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
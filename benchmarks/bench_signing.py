@@ -0,0 +1,41 @@
+"""Per-signature cost of raw-secret HMAC vs. pre-keyed keyring states.
+
+Usage: python benchmarks/bench_signing.py [iterations]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execlayer_kernel.crypto import SigningKeyring, canonical_json, hmac_sign, verify_receipts
+from execlayer_kernel.receipts import sign_receipt
+
+SECRET = b"bench_secret_" + b"x" * 51
+
+def _receipt(i: int) -> dict:
+    return {
+        "receipt_id": f"rcpt_{i:010d}",
+        "timestamp_utc": "2026-01-01T00:00:00Z",
+        "intercepted": {"tool": "read_slack_history", "parameters": {"channel": "c", "search": "api_key"}},
+        "verdict": {"status": "BLOCK", "latency_ms": 0, "policy": {"rule_id": "R-SECR-002"}}
+    }
+
+def _report(label: str, seconds: float, n: int) -> None:
+    print(f"{label:<32} {seconds / n * 1e6:8.3f} us/op")
+
+def main(n: int) -> None:
+    keyring = SigningKeyring({"k1": SECRET})
+    message = canonical_json(_receipt(0))
+
+    _report("hmac_sign (raw secret)", timeit.timeit(lambda: hmac_sign(SECRET, message), number=n), n)
+    _report("SigningKeyring.sign (cloned)", timeit.timeit(lambda: keyring.sign(message), number=n), n)
+    _report("sign_receipt (keyring)", timeit.timeit(lambda: sign_receipt(_receipt(0), keyring), number=n), n)
+
+    receipts = [sign_receipt(_receipt(i), keyring) for i in range(n)]
+    keyring.rotate("k2", b"rotated_" + SECRET)
+    receipts += [sign_receipt(_receipt(i), keyring) for i in range(n)]
+    _report("verify_receipts (2 keys, bulk)", timeit.timeit(lambda: verify_receipts(receipts, keyring), number=1), len(receipts))
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,244 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+BATCH_ROWS = 65536
+
+# name -> dtype; string columns are dictionary-encoded as int32 codes (-1 = missing).
+COLUMNS: Dict[str, str] = {
+    "event": "int32",
+    "tool": "int32",
+    "agent_id": "int32",
+    "rule_id": "int32",
+    "risk_tier": "int32",
+    "risk_score": "float64",
+    "latency_ms": "float64"
+}
+STRING_COLUMNS = ("event", "tool", "agent_id", "rule_id", "risk_tier")
+
+def _row_values(payload: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+    receipt = payload.get("receipt")
+    if receipt is None:
+        return (
+            payload.get("event"), payload.get("tool"), payload.get("agent_id"),
+            None, None, None, payload.get("latency_ms")
+        )
+    verdict = receipt.get("verdict", {})
+    risk = verdict.get("risk", {})
+    return (
+        payload.get("event"),
+        receipt.get("intercepted", {}).get("tool"),
+        receipt.get("agent", {}).get("agent_id"),
+        verdict.get("policy", {}).get("rule_id"),
+        risk.get("tier"),
+        risk.get("score"),
+        verdict.get("latency_ms")
+    )
+
+def _empty_manifest(source: str) -> Dict[str, Any]:
+    return {
+        "source": os.path.abspath(source),
+        "offset": 0,
+        "rows": 0,
+        "malformed": 0,
+        "last_entry_hash": None,
+        "dictionaries": {name: [] for name in STRING_COLUMNS}
+    }
+
+def _read_manifest(out_dir: str) -> Optional[Dict[str, Any]]:
+    path = os.path.join(out_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _write_manifest(out_dir: str, manifest: Dict[str, Any]) -> None:
+    path = os.path.join(out_dir, MANIFEST)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+def _column_path(out_dir: str, name: str) -> str:
+    return os.path.join(out_dir, f"{name}.bin")
+
+class _Encoder:
+    def __init__(self, values: List[str]):
+        self.values = values
+        self.codes = {v: i for i, v in enumerate(values)}
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+def _flush(out_dir: str, batch: List[Tuple[Any, ...]], encoders: Dict[str, _Encoder]) -> None:
+    names = list(COLUMNS)
+    for i, name in enumerate(names):
+        if name in encoders:
+            enc = encoders[name]
+            data = [enc.encode(row[i]) for row in batch]
+        else:
+            data = [np.nan if row[i] is None else row[i] for row in batch]
+        arr = np.asarray(data, dtype=COLUMNS[name])
+        with open(_column_path(out_dir, name), "ab") as f:
+            f.write(arr.tobytes())
+
+def export_columns(audit_log_path: str, out_dir: str, batch_rows: int = BATCH_ROWS) -> Dict[str, Any]:
+    """Appends audit entries written since the last export to the columnar store.
+
+    Only bytes past the recorded source offset are read; a trailing line without
+    a newline is left for the next run. Complete lines that are not valid audit
+    entries are skipped and counted in ``malformed``. Returns the updated manifest.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest = _read_manifest(out_dir) or _empty_manifest(audit_log_path)
+    if manifest["source"] != os.path.abspath(audit_log_path):
+        raise ValueError(f"{out_dir} was exported from {manifest['source']}, not {audit_log_path}")
+
+    size = os.path.getsize(audit_log_path)
+    if size < manifest["offset"]:
+        raise ValueError("Audit log is shorter than the exported offset; it was truncated or rotated.")
+
+    # Drop any column bytes written after the last committed manifest.
+    for name, dtype in COLUMNS.items():
+        with open(_column_path(out_dir, name), "ab") as f:
+            f.truncate(manifest["rows"] * np.dtype(dtype).itemsize)
+
+    encoders = {name: _Encoder(manifest["dictionaries"][name]) for name in STRING_COLUMNS}
+    offset = manifest["offset"]
+    rows = manifest["rows"]
+    malformed = manifest.get("malformed", 0)
+    last_hash = manifest["last_entry_hash"]
+    batch: List[Tuple[Any, ...]] = []
+
+    with open(audit_log_path, "rb", buffering=1024 * 1024) as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if not line.strip():
+                continue
+            try:
+                wrapped = json.loads(line)
+            except ValueError:
+                wrapped = None
+            if not isinstance(wrapped, dict) or not isinstance(wrapped.get("payload", {}), dict):
+                # The skipped entry's hash is unknown, so the next link cannot be checked.
+                malformed += 1
+                last_hash = None
+                continue
+            # A null prev_entry_hash marks a kernel restart, which begins a new chain.
+            prev = wrapped.get("prev_entry_hash")
+            if last_hash is not None and prev is not None and prev != last_hash:
+                raise ValueError(f"Hash chain break after {last_hash}; refusing incremental export.")
+            last_hash = wrapped.get("entry_hash")
+            batch.append(_row_values(wrapped.get("payload", {})))
+            rows += 1
+            if len(batch) >= batch_rows:
+                _flush(out_dir, batch, encoders)
+                batch = []
+    if batch:
+        _flush(out_dir, batch, encoders)
+
+    manifest.update({
+        "offset": offset,
+        "rows": rows,
+        "malformed": malformed,
+        "last_entry_hash": last_hash,
+        "dictionaries": {name: enc.values for name, enc in encoders.items()}
+    })
+    _write_manifest(out_dir, manifest)
+    return manifest
+
+class ReceiptColumns:
+    """Memory-mapped view of an exported columnar store with vectorized reports."""
+
+    def __init__(self, out_dir: str):
+        manifest = _read_manifest(out_dir)
+        if manifest is None:
+            raise FileNotFoundError(f"No columnar export found in {out_dir}")
+        self.rows: int = manifest["rows"]
+        self.malformed: int = manifest.get("malformed", 0)
+        self.dictionaries: Dict[str, List[str]] = manifest["dictionaries"]
+        self.columns: Dict[str, np.ndarray] = {}
+        for name, dtype in COLUMNS.items():
+            if self.rows == 0:
+                self.columns[name] = np.empty(0, dtype=dtype)
+            else:
+                self.columns[name] = np.memmap(
+                    _column_path(out_dir, name), dtype=dtype, mode="r", shape=(self.rows,)
+                )
+
+    def _labels(self, name: str) -> List[Optional[str]]:
+        # Code -1 (missing) is shifted to slot 0.
+        return [None] + list(self.dictionaries[name])
+
+    def verdict_counts(self, by: str) -> Dict[Optional[str], Dict[str, int]]:
+        if by not in STRING_COLUMNS or by == "event":
+            raise ValueError(f"Cannot group verdict counts by {by!r}")
+        groups = self._labels(by)
+        events = self._labels("event")
+        keys = (self.columns[by].astype(np.int64) + 1) * len(events) + (self.columns["event"] + 1)
+        counts = np.bincount(keys, minlength=len(groups) * len(events)).reshape(len(groups), len(events))
+        report: Dict[Optional[str], Dict[str, int]] = {}
+        for g, e in zip(*np.nonzero(counts)):
+            report.setdefault(groups[g], {})[events[e] or "UNKNOWN"] = int(counts[g, e])
+        return report
+
+    def risk_score_distribution(self, bins: Sequence[float] = tuple(range(11))) -> Dict[str, Any]:
+        scores = self.columns["risk_score"]
+        scores = scores[~np.isnan(scores)]
+        hist, edges = np.histogram(scores, bins=np.asarray(bins, dtype="float64"))
+        return {
+            "count": int(scores.size),
+            "mean": float(scores.mean()) if scores.size else None,
+            "bin_edges": edges.tolist(),
+            "counts": hist.tolist()
+        }
+
+    def latency_percentiles(
+        self,
+        percentiles: Iterable[float] = (50, 90, 99),
+        by: Optional[str] = None
+    ) -> Dict[Optional[str], Dict[str, float]]:
+        qs = list(percentiles)
+        latency = self.columns["latency_ms"]
+        valid = ~np.isnan(latency)
+
+        def pct(values: np.ndarray) -> Dict[str, float]:
+            if values.size == 0:
+                return {}
+            return {f"p{q:g}": float(v) for q, v in zip(qs, np.percentile(values, qs))}
+
+        if by is None:
+            return {None: pct(latency[valid])}
+        labels = self._labels(by)
+        codes = self.columns[by][valid] + 1
+        values = latency[valid]
+        order = np.argsort(codes, kind="stable")
+        codes, values = codes[order], values[order]
+        uniq, starts = np.unique(codes, return_index=True)
+        bounds = list(starts[1:]) + [codes.size]
+        return {labels[c]: pct(values[s:e]) for c, s, e in zip(uniq, starts, bounds)}
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "malformed": self.malformed,
+            "verdicts_by_rule": self.verdict_counts("rule_id"),
+            "verdicts_by_agent": self.verdict_counts("agent_id"),
+            "verdicts_by_tool": self.verdict_counts("tool"),
+            "risk_score": self.risk_score_distribution(),
+            "latency_ms": self.latency_percentiles()[None],
+            "latency_ms_by_tool": self.latency_percentiles(by="tool")
+        }
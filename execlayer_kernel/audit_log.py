@@ -2,15 +2,17 @@ import json
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 from .crypto import canonical_json, link_hash, sha256_hex
+from .stream import DecisionStream
 
 @dataclass
 class AuditState:
     prev_entry_hash: Optional[str] = None
 
 class AppendOnlyAuditLog:
-    def __init__(self, path: str):
+    def __init__(self, path: str, stream: Optional[DecisionStream] = None):
         self.path = path
         self.state = AuditState()
+        self.stream = stream
 
     def append(self, entry: Dict[str, Any]) -> Dict[str, Any]:
         payload = canonical_json(entry)
@@ -24,8 +26,12 @@ class AppendOnlyAuditLog:
             "prev_entry_hash": f"sha256:{self.state.prev_entry_hash}" if self.state.prev_entry_hash else None
         }
 
+        line = json.dumps(wrapped, ensure_ascii=False)
         with open(self.path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(wrapped, ensure_ascii=False) + "\n")
+            f.write(line + "\n")
 
         self.state.prev_entry_hash = entry_hash
+        if self.stream is not None:
+            # Subscribers get the on-disk line: callers mutate the entry after append.
+            self.stream.publish(wrapped, line)
         return wrapped
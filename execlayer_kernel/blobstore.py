@@ -0,0 +1,97 @@
+import hashlib
+import os
+import re
+import tempfile
+from typing import Any, Dict, Iterator
+
+# Reserved for kernel-made references; validation rejects it in caller parameters.
+BLOB_REF_KEY = "$execlayer_blob_ref"
+CHUNK_CHARS = 1 << 20
+FORGED_REF_PLACEHOLDER = "[rejected: reserved blob reference]"
+
+_DIGEST_RE = re.compile(r"sha256:[0-9a-f]{64}")
+
+def _encoded_chunks(value: str) -> Iterator[bytes]:
+    for i in range(0, len(value), CHUNK_CHARS):
+        yield value[i:i + CHUNK_CHARS].encode("utf-8")
+
+def is_blob_ref(value: Any) -> bool:
+    return isinstance(value, dict) and BLOB_REF_KEY in value
+
+def contains_blob_ref(value: Any) -> bool:
+    if isinstance(value, dict):
+        return BLOB_REF_KEY in value or any(contains_blob_ref(v) for v in value.values())
+    if isinstance(value, list):
+        return any(contains_blob_ref(v) for v in value)
+    return False
+
+def strip_blob_refs(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: FORGED_REF_PLACEHOLDER if contains_blob_ref(v) else v for k, v in params.items()}
+
+class BlobStore:
+    """Deduplicated on-disk store for large string parameters, keyed by SHA-256.
+
+    Receipts carry ``{"$execlayer_blob_ref": "sha256:<hex>", "bytes": n}`` in
+    place of the value, so the receipt signature covers the content through its
+    digest. Only well-formed digests map to paths, and only inside ``root``.
+    """
+
+    def __init__(self, root: str, threshold_chars: int = 64 * 1024):
+        self.root = root
+        self.threshold_chars = threshold_chars
+
+    def path_for(self, digest: Any) -> str:
+        if not isinstance(digest, str) or not _DIGEST_RE.fullmatch(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        hexdigest = digest[len("sha256:"):]
+        return os.path.join(self.root, hexdigest[:2], hexdigest)
+
+    def put(self, value: str) -> Dict[str, Any]:
+        hasher = hashlib.sha256()
+        size = 0
+        for chunk in _encoded_chunks(value):
+            hasher.update(chunk)
+            size += len(chunk)
+        digest = f"sha256:{hasher.hexdigest()}"
+
+        path = self.path_for(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in _encoded_chunks(value):
+                        f.write(chunk)
+                os.replace(tmp, path)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+        return {BLOB_REF_KEY: digest, "bytes": size}
+
+    def get(self, ref: Dict[str, Any]) -> str:
+        digest = ref[BLOB_REF_KEY]
+        with open(self.path_for(digest), "rb") as f:
+            data = f.read()
+        if f"sha256:{hashlib.sha256(data).hexdigest()}" != digest:
+            raise ValueError(f"Blob content does not match digest {digest}")
+        return data.decode("utf-8")
+
+    def externalize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if contains_blob_ref(params):
+            raise ValueError("Parameters must not carry reserved blob references")
+        if not any(isinstance(v, str) and len(v) > self.threshold_chars for v in params.values()):
+            return params
+        return {
+            k: self.put(v) if isinstance(v, str) and len(v) > self.threshold_chars else v
+            for k, v in params.items()
+        }
+
+    @staticmethod
+    def has_refs(params: Dict[str, Any]) -> bool:
+        return any(is_blob_ref(v) for v in params.values())
+
+    def resolve(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if not self.has_refs(params):
+            return params
+        return {k: self.get(v) if is_blob_ref(v) else v for k, v in params.items()}
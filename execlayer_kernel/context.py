@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from .constants import DataClass
 
 @dataclass(frozen=True)
@@ -26,3 +26,49 @@ class ExecutionContext:
     jurisdiction: str
     data_class: DataClass
     attributes: Dict[str, str]
+
+def context_to_dict(ctx: ExecutionContext) -> Dict[str, Any]:
+    return {
+        "actor": {
+            "id": ctx.actor.id,
+            "display": ctx.actor.display,
+            "org_unit": ctx.actor.org_unit,
+            "role": ctx.actor.role
+        },
+        "agent_id": ctx.agent_id,
+        "session_id": ctx.session_id,
+        "intent": {
+            "statement": ctx.intent.statement,
+            "purpose": ctx.intent.purpose,
+            "business_process": ctx.intent.business_process,
+            "ticket_id": ctx.intent.ticket_id
+        },
+        "environment": ctx.environment,
+        "jurisdiction": ctx.jurisdiction,
+        "data_class": ctx.data_class.value,
+        "attributes": dict(ctx.attributes)
+    }
+
+def context_from_dict(data: Dict[str, Any]) -> ExecutionContext:
+    actor = data["actor"]
+    intent = data["intent"]
+    return ExecutionContext(
+        actor=Actor(
+            id=actor["id"],
+            display=actor["display"],
+            org_unit=actor["org_unit"],
+            role=actor["role"]
+        ),
+        agent_id=data["agent_id"],
+        session_id=data["session_id"],
+        intent=Intent(
+            statement=intent["statement"],
+            purpose=intent["purpose"],
+            business_process=intent["business_process"],
+            ticket_id=intent.get("ticket_id")
+        ),
+        environment=data["environment"],
+        jurisdiction=data["jurisdiction"],
+        data_class=DataClass(data["data_class"]),
+        attributes=dict(data.get("attributes") or {})
+    )
@@ -2,7 +2,8 @@ import base64
 import hashlib
 import hmac
 import json
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 def canonical_json(obj: Dict[str, Any]) -> str:
     return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
@@ -17,3 +18,91 @@ def hmac_sign(secret: bytes, message: str) -> str:
 def link_hash(prev_hash: Optional[str], payload_hash: str) -> str:
     base = (prev_hash or "") + ":" + payload_hash
     return sha256_hex(base)
+
+class SigningKeyring:
+    """HMAC-SHA256 keys by key id, each held as a pre-keyed state cloned per message.
+
+    One key is active for signing; rotated-out keys are retained for
+    verification until retired. Rotation swaps state under a lock, so it can
+    happen at runtime while other threads sign.
+    """
+
+    def __init__(self, keys: Dict[str, bytes], active_kid: Optional[str] = None):
+        if not keys:
+            raise ValueError("Keyring needs at least one key")
+        self._lock = threading.Lock()
+        self._states = {kid: hmac.new(secret, digestmod=hashlib.sha256) for kid, secret in keys.items()}
+        kid = active_kid or next(iter(keys))
+        if kid not in self._states:
+            raise KeyError(f"Unknown key id: {kid}")
+        self._active: Tuple[str, Any] = (kid, self._states[kid])
+
+    @property
+    def active_kid(self) -> str:
+        return self._active[0]
+
+    def kids(self) -> List[str]:
+        with self._lock:
+            return list(self._states)
+
+    def sign(self, message: str) -> Tuple[str, str]:
+        kid, state = self._active
+        mac = state.copy()
+        mac.update(message.encode("utf-8"))
+        return kid, base64.b64encode(mac.digest()).decode("utf-8")
+
+    def rotate(self, kid: str, secret: bytes) -> None:
+        state = hmac.new(secret, digestmod=hashlib.sha256)
+        with self._lock:
+            if kid in self._states:
+                raise ValueError(f"Key id already in keyring: {kid}")
+            self._states[kid] = state
+            self._active = (kid, state)
+
+    def retire(self, kid: str) -> None:
+        with self._lock:
+            if kid == self._active[0]:
+                raise ValueError("Cannot retire the active signing key")
+            self._states.pop(kid, None)
+
+    def verify(self, kid: Optional[str], message: str, signature_b64: str) -> bool:
+        try:
+            expected = base64.b64decode(signature_b64)
+        except (ValueError, TypeError):
+            return False
+        with self._lock:
+            if kid is not None:
+                states = [self._states[kid]] if kid in self._states else []
+            else:
+                # Receipts signed before key ids existed: try every retained key.
+                states = list(self._states.values())
+        data = message.encode("utf-8")
+        for state in states:
+            mac = state.copy()
+            mac.update(data)
+            if hmac.compare_digest(mac.digest(), expected):
+                return True
+        return False
+
+def verify_receipts(receipts: Iterable[Dict[str, Any]], keyring: SigningKeyring) -> Dict[str, Any]:
+    verified = 0
+    failed: List[Optional[str]] = []
+    unknown_kid: List[Optional[str]] = []
+    retained = set(keyring.kids())
+    for receipt in receipts:
+        crypto = receipt.get("crypto") or {}
+        kid = crypto.get("kid")
+        if kid is not None and kid not in retained:
+            unknown_kid.append(receipt.get("receipt_id"))
+            continue
+        # "crypto" and "audit" are attached after signing.
+        body = {k: v for k, v in receipt.items() if k not in ("crypto", "audit")}
+        payload = canonical_json(body)
+        ok = crypto.get("payload_hash") == f"sha256:{sha256_hex(payload)}" and keyring.verify(
+            kid, payload, crypto.get("signature_b64", "")
+        )
+        if ok:
+            verified += 1
+        else:
+            failed.append(receipt.get("receipt_id"))
+    return {"verified": verified, "failed": failed, "unknown_kid": unknown_kid}
@@ -3,9 +3,14 @@ import uuid
 from typing import Any, Dict, Optional
 
 from .audit_log import AppendOnlyAuditLog
+from .blobstore import BlobStore, strip_blob_refs
 from .constants import Verdict, RiskTier
-from .policy_bundle import PolicyBundle, PolicyOutcome
+from .context import context_to_dict
+from .crypto import SigningKeyring
+from .policy_bundle import PolicyBundle, PolicyOutcome, evaluate_bundle
 from .receipts import attach_governance, build_receipt_base, sign_receipt
+from .shadow import ShadowEvaluator
+from .stream import DecisionStream
 from .validation import validate_tool_call
 
 class ExecLayerKernel:
@@ -14,12 +19,43 @@ class ExecLayerKernel:
         policy_bundle: PolicyBundle,
         audit_log_path: str = "execlayer_audit.log.jsonl",
         signing_secret: bytes = b"dev_secret_change_me",
-        mode: str = "demo"
+        mode: str = "demo",
+        shadow_bundle: Optional[PolicyBundle] = None,
+        shadow_workers: int = 2,
+        shadow_queue_size: int = 1024,
+        capture_replay: bool = False,
+        decision_stream: Optional[DecisionStream] = None,
+        blob_store: Optional[BlobStore] = None,
+        keyring: Optional[SigningKeyring] = None,
+        signing_key_id: str = "default"
     ):
         self.policy_bundle = policy_bundle
-        self.audit_log = AppendOnlyAuditLog(audit_log_path)
-        self.signing_secret = signing_secret
+        self.audit_log = AppendOnlyAuditLog(audit_log_path, stream=decision_stream)
+        self.keyring = keyring or SigningKeyring({signing_key_id: signing_secret})
         self.mode = mode
+        self.capture_replay = capture_replay
+        self.blob_store = blob_store
+        self.shadow: Optional[ShadowEvaluator] = None
+        if shadow_bundle is not None:
+            self.enable_shadow(shadow_bundle, shadow_workers, shadow_queue_size)
+
+    def rotate_signing_key(self, kid: str, secret: bytes) -> None:
+        self.keyring.rotate(kid, secret)
+
+    def retire_signing_key(self, kid: str) -> None:
+        self.keyring.retire(kid)
+
+    def enable_shadow(self, bundle: PolicyBundle, workers: int = 2, queue_size: int = 1024) -> None:
+        self.disable_shadow()
+        self.shadow = ShadowEvaluator(bundle, workers=workers, queue_size=queue_size)
+
+    def disable_shadow(self) -> None:
+        shadow, self.shadow = self.shadow, None
+        if shadow is not None:
+            shadow.close()
+
+    def shadow_stats(self) -> Optional[Dict[str, Any]]:
+        return self.shadow.stats() if self.shadow is not None else None
 
     def intercept(self, ctx, tool_call: Dict[str, Any]) -> Dict[str, Any]:
         start = time.time()
@@ -41,22 +77,31 @@ class ExecLayerKernel:
 
         latency_ms = int((time.time() - start) * 1000)
 
+        shadow = self.shadow
+        if shadow is not None:
+            shadow.submit(ctx, tool_name, params, outcome)
+
         if outcome is None:
             result = {
                 "status": Verdict.ALLOW.value,
                 "mode": self.mode,
                 "output": "Mock execution succeeded (demo mode)." if self.mode == "demo" else "Execution authorized."
             }
-            self.audit_log.append({
+            entry = {
                 "event": "ALLOW",
                 "session_id": ctx.session_id,
                 "agent_id": ctx.agent_id,
                 "tool": tool_name,
                 "latency_ms": latency_ms
-            })
+            }
+            if self.capture_replay:
+                entry["replay"] = self._replay_record(ctx, tool_name, self._externalize(params))
+            self.audit_log.append(entry)
             return result
 
-        receipt = build_receipt_base(ctx, tool_name, params)
+        # Rules see the full values; receipts and audit entries carry blob refs.
+        recorded_params = self._externalize(params)
+        receipt = build_receipt_base(ctx, tool_name, recorded_params)
         attach_governance(receipt, outcome, latency_ms)
 
         if outcome.verdict == Verdict.BLOCK:
@@ -74,12 +119,16 @@ class ExecLayerKernel:
         if self.mode == "demo":
             receipt["disclaimer"] = "This is a demonstration. In production, this would block actual tool execution."
 
-        sign_receipt(receipt, self.signing_secret)
+        sign_receipt(receipt, self.keyring)
 
-        wrapped = self.audit_log.append({
+        entry = {
             "event": outcome.verdict.value,
             "receipt": receipt
-        })
+        }
+        if self.capture_replay:
+            # The receipt already carries the tool call and most of the context.
+            entry["replay"] = {"attributes": dict(ctx.attributes)}
+        wrapped = self.audit_log.append(entry)
 
         receipt["audit"] = {
             "entry_hash": wrapped["entry_hash"],
@@ -90,7 +139,11 @@ class ExecLayerKernel:
 
     def _create_error_receipt(self, ctx, tool_call, error_msg, start_time):
         latency_ms = int((time.time() - start_time) * 1000)
-        receipt = build_receipt_base(ctx, tool_call.get("function", "unknown"), tool_call.get("parameters", {}))
+        params = tool_call.get("parameters", {})
+        if isinstance(params, dict):
+            # Validation may have failed on a forged ref; never record it as one.
+            params = self._externalize(strip_blob_refs(params))
+        receipt = build_receipt_base(ctx, tool_call.get("function", "unknown"), params)
         receipt["verdict"] = {
             "status": "ERROR",
             "latency_ms": latency_ms,
@@ -100,6 +153,17 @@ class ExecLayerKernel:
         receipt["enforcement"] = {"action": "BLOCKED_DUE_TO_ERROR"}
         return receipt
 
+    def _externalize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if self.blob_store is None:
+            return params
+        return self.blob_store.externalize(params)
+
+    def _replay_record(self, ctx, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "context": context_to_dict(ctx),
+            "tool_call": {"function": tool_name, "parameters": params}
+        }
+
     def _mint_approval_id(self) -> str:
         return "appr_" + uuid.uuid4().hex[:10]
 
@@ -133,9 +197,4 @@ class ExecLayerKernel:
         )
 
     def _evaluate(self, ctx, tool_name: str, params: Dict[str, Any]) -> Optional[PolicyOutcome]:
-        rules = sorted(self.policy_bundle.rules, key=lambda r: r.priority, reverse=True)
-        for rule in rules:
-            outcome = rule.evaluate(ctx, tool_name, params)
-            if outcome:
-                return outcome
-        return None
+        return evaluate_bundle(self.policy_bundle, ctx, tool_name, params)
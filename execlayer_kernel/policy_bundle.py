@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from .constants import RiskTier, Verdict
 
 @dataclass(frozen=True)
@@ -25,3 +25,16 @@ class PolicyBundle:
     bundle_id: str
     version: str
     rules: List[PolicyRule]
+
+def evaluate_bundle(bundle: PolicyBundle, ctx, tool_name: str, params: Dict[str, Any]) -> Optional[PolicyOutcome]:
+    rules = sorted(bundle.rules, key=lambda r: r.priority, reverse=True)
+    for rule in rules:
+        outcome = rule.evaluate(ctx, tool_name, params)
+        if outcome:
+            return outcome
+    return None
+
+def outcome_verdict(outcome: Optional[PolicyOutcome]) -> Tuple[str, Optional[str]]:
+    if outcome is None:
+        return Verdict.ALLOW.value, None
+    return outcome.verdict.value, outcome.rule_id
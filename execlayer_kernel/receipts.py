@@ -1,8 +1,8 @@
 import datetime
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from .bok import BOK_2_1
-from .crypto import canonical_json, hmac_sign, sha256_hex
+from .crypto import SigningKeyring, canonical_json, hmac_sign, sha256_hex
 
 def utc_now_iso() -> str:
     return datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
@@ -64,14 +64,18 @@ def attach_governance(receipt: Dict[str, Any], outcome, latency_ms: int) -> None
         }
     }
 
-def sign_receipt(receipt: Dict[str, Any], signing_secret: bytes) -> Dict[str, Any]:
+def sign_receipt(receipt: Dict[str, Any], signer: Union[SigningKeyring, bytes]) -> Dict[str, Any]:
     payload = canonical_json(receipt)
     payload_hash = sha256_hex(payload)
-    signature = hmac_sign(signing_secret, payload)
 
-    receipt["crypto"] = {
+    crypto = {
         "payload_hash": f"sha256:{payload_hash}",
-        "signature_type": "HMAC-SHA256",
-        "signature_b64": signature
+        "signature_type": "HMAC-SHA256"
     }
+    if isinstance(signer, SigningKeyring):
+        crypto["kid"], crypto["signature_b64"] = signer.sign(payload)
+    else:
+        crypto["signature_b64"] = hmac_sign(signer, payload)
+
+    receipt["crypto"] = crypto
     return receipt
@@ -0,0 +1,215 @@
+import json
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .blobstore import BlobStore
+from .constants import Verdict
+from .context import ExecutionContext, context_from_dict
+from .policy_bundle import PolicyBundle, evaluate_bundle, outcome_verdict
+
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+MIN_CHUNK_BYTES = 1024 * 1024
+
+@dataclass
+class ReplayReport:
+    """Verdict diff between the recorded audit log and a candidate bundle."""
+    entries: int = 0
+    replayed: int = 0
+    unreplayable: int = 0
+    unresolved_blob: int = 0
+    malformed: int = 0
+    errors: int = 0
+    agreed: int = 0
+    disagreed: int = 0
+    transitions: Counter = field(default_factory=Counter)
+    rule_pairs: Counter = field(default_factory=Counter)
+    samples: List[Dict[str, Any]] = field(default_factory=list)
+    max_samples: int = 100
+
+    def merge(self, other: "ReplayReport") -> "ReplayReport":
+        self.entries += other.entries
+        self.replayed += other.replayed
+        self.unreplayable += other.unreplayable
+        self.unresolved_blob += other.unresolved_blob
+        self.malformed += other.malformed
+        self.errors += other.errors
+        self.agreed += other.agreed
+        self.disagreed += other.disagreed
+        self.transitions.update(other.transitions)
+        self.rule_pairs.update(other.rule_pairs)
+        room = self.max_samples - len(self.samples)
+        if room > 0:
+            self.samples.extend(other.samples[:room])
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entries": self.entries,
+            "replayed": self.replayed,
+            "unreplayable": self.unreplayable,
+            "unresolved_blob": self.unresolved_blob,
+            "malformed": self.malformed,
+            "errors": self.errors,
+            "agreed": self.agreed,
+            "disagreed": self.disagreed,
+            "disagreement_rate": (self.disagreed / self.replayed) if self.replayed else 0.0,
+            "transitions": {f"{a}->{b}": n for (a, b), n in self.transitions.items()},
+            "rule_pairs": [
+                {"recorded_rule_id": a, "candidate_rule_id": b, "count": n}
+                for (a, b), n in self.rule_pairs.most_common()
+            ],
+            "samples": list(self.samples)
+        }
+
+def _context_from_receipt(receipt: Dict[str, Any], attributes: Dict[str, str]) -> ExecutionContext:
+    agent = receipt["agent"]
+    return context_from_dict({
+        "actor": receipt["actor"],
+        "agent_id": agent["agent_id"],
+        "session_id": agent["session_id"],
+        "intent": receipt["intent"],
+        "environment": agent["environment"],
+        "jurisdiction": receipt["context"]["jurisdiction"],
+        "data_class": receipt["context"]["data_class"],
+        "attributes": attributes
+    })
+
+def rebuild_entry(payload: Dict[str, Any]) -> Optional[Tuple[ExecutionContext, str, Dict[str, Any]]]:
+    replay = payload.get("replay") or {}
+    if "tool_call" in replay:
+        tool_call = replay["tool_call"]
+        return context_from_dict(replay["context"]), tool_call["function"], tool_call["parameters"]
+    receipt = payload.get("receipt")
+    if receipt is not None and "intercepted" in receipt:
+        # Receipts carry the tool call and context; replay capture adds only the
+        # attributes, and receipts written without capture rebuild with none.
+        intercepted = receipt["intercepted"]
+        ctx = _context_from_receipt(receipt, replay.get("attributes") or {})
+        return ctx, intercepted["tool"], intercepted["parameters"]
+    return None
+
+def recorded_verdict(payload: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    event = payload.get("event", Verdict.ALLOW.value)
+    if event == Verdict.ALLOW.value:
+        return event, None
+    policy = payload.get("receipt", {}).get("verdict", {}).get("policy", {})
+    return event, policy.get("rule_id")
+
+def _iter_lines(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb", buffering=1024 * 1024) as f:
+        if start > 0:
+            # Skip the partial line owned by the previous chunk.
+            f.seek(start - 1)
+            pos = start - 1 + len(f.readline())
+        else:
+            pos = 0
+        while pos < end:
+            line = f.readline()
+            if not line:
+                break
+            pos += len(line)
+            yield line
+
+def _replay_chunk(args: Tuple[str, int, int, PolicyBundle, int, Optional[str]]) -> ReplayReport:
+    path, start, end, bundle, max_samples, blob_dir = args
+    blobs = BlobStore(blob_dir) if blob_dir else None
+    report = ReplayReport(max_samples=max_samples)
+    for line in _iter_lines(path, start, end):
+        if not line.strip():
+            continue
+        report.entries += 1
+        try:
+            wrapped = json.loads(line)
+            payload = wrapped["payload"]
+            rebuilt = rebuild_entry(payload)
+        except (ValueError, KeyError, TypeError):
+            report.malformed += 1
+            continue
+        if rebuilt is None:
+            report.unreplayable += 1
+            continue
+        ctx, tool_name, params = rebuilt
+        if BlobStore.has_refs(params):
+            # Rules expect the original strings; never evaluate against blob refs.
+            if blobs is None:
+                report.unresolved_blob += 1
+                continue
+            try:
+                params = blobs.resolve(params)
+            except (OSError, ValueError):
+                report.unresolved_blob += 1
+                continue
+        try:
+            outcome = evaluate_bundle(bundle, ctx, tool_name, params)
+        except Exception:
+            report.errors += 1
+            continue
+        report.replayed += 1
+        before = recorded_verdict(payload)
+        after = outcome_verdict(outcome)
+        if before[0] == after[0]:
+            report.agreed += 1
+            continue
+        report.disagreed += 1
+        report.transitions[(before[0], after[0])] += 1
+        report.rule_pairs[(before[1], after[1])] += 1
+        if len(report.samples) < max_samples:
+            report.samples.append({
+                "entry_hash": wrapped.get("entry_hash"),
+                "session_id": ctx.session_id,
+                "agent_id": ctx.agent_id,
+                "tool": tool_name,
+                "recorded_verdict": before[0],
+                "recorded_rule_id": before[1],
+                "candidate_verdict": after[0],
+                "candidate_rule_id": after[1]
+            })
+    return report
+
+def _auto_chunk_bytes(size: int, workers: int) -> int:
+    # Small logs are split evenly across the workers; large ones use capped chunks.
+    per_worker = -(-size // max(1, workers))
+    return max(MIN_CHUNK_BYTES, min(MAX_CHUNK_BYTES, per_worker))
+
+def _chunk_ranges(size: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    chunk_bytes = max(1, chunk_bytes)
+    return [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+def replay_audit_log(
+    path: str,
+    bundle: PolicyBundle,
+    workers: Optional[int] = None,
+    chunk_bytes: Optional[int] = None,
+    max_samples: int = 100,
+    blob_dir: Optional[str] = None
+) -> Dict[str, Any]:
+    """Replays an audit log against ``bundle`` and returns a verdict-diff report.
+
+    The file is split into byte ranges aligned to line boundaries; each range is
+    streamed by a worker process, so memory use is bounded by the chunk reader
+    rather than the log size. Entries need the replay capture written by
+    ``ExecLayerKernel(capture_replay=True)``; blocked/escalated receipts without
+    it are rebuilt from the receipt itself, and other entries are counted as
+    unreplayable. Parameters stored by reference are read back from ``blob_dir``;
+    entries whose blobs cannot be resolved are counted as unresolved_blob.
+    """
+    size = os.path.getsize(path)
+    if chunk_bytes is None:
+        chunk_bytes = _auto_chunk_bytes(size, workers or os.cpu_count() or 1)
+    ranges = _chunk_ranges(size, chunk_bytes)
+    report = ReplayReport(max_samples=max_samples)
+    if not ranges:
+        return report.to_dict()
+
+    tasks = [(path, start, end, bundle, max_samples, blob_dir) for start, end in ranges]
+    if workers == 1 or len(tasks) == 1:
+        for task in tasks:
+            report.merge(_replay_chunk(task))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial in pool.map(_replay_chunk, tasks):
+                report.merge(partial)
+    return report.to_dict()
@@ -0,0 +1,234 @@
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import weakref
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from .policy_bundle import PolicyBundle, PolicyOutcome, evaluate_bundle, outcome_verdict
+
+FLUSH_INTERVAL_S = 0.01
+MAX_BATCH = 256
+
+@dataclass(frozen=True)
+class ShadowDisagreement:
+    timestamp: float
+    session_id: str
+    agent_id: str
+    tool: str
+    active_verdict: str
+    active_rule_id: Optional[str]
+    shadow_verdict: str
+    shadow_rule_id: Optional[str]
+
+def _lower_priority() -> None:
+    # Shadow work must never compete with the request path, even on one core.
+    try:
+        os.sched_setscheduler(0, os.SCHED_IDLE, os.sched_param(0))
+    except (AttributeError, OSError):
+        try:
+            os.nice(19)
+        except (AttributeError, OSError):
+            pass
+
+def _shadow_worker(bundle: PolicyBundle, tasks, results) -> None:
+    _lower_priority()
+    agreed = errors = 0
+    while True:
+        try:
+            batch = tasks.get(timeout=FLUSH_INTERVAL_S * 10)
+        except queue.Empty:
+            batch = []
+        if batch is None:
+            break
+        for ctx, tool_name, params, active_verdict, active_rule in batch:
+            try:
+                shadow_verdict, shadow_rule = outcome_verdict(evaluate_bundle(bundle, ctx, tool_name, params))
+            except Exception:
+                errors += 1
+                continue
+            if shadow_verdict == active_verdict:
+                agreed += 1
+                continue
+            results.put(ShadowDisagreement(
+                timestamp=time.time(),
+                session_id=ctx.session_id,
+                agent_id=ctx.agent_id,
+                tool=tool_name,
+                active_verdict=active_verdict,
+                active_rule_id=active_rule,
+                shadow_verdict=shadow_verdict,
+                shadow_rule_id=shadow_rule
+            ))
+        # Agreement counts go back per batch (or when idle), not per sample.
+        if agreed or errors:
+            results.put((agreed, errors))
+            agreed = errors = 0
+
+class _ShadowState:
+    def __init__(self, max_disagreements: int):
+        self.lock = threading.Lock()
+        self.disagreements: Deque[ShadowDisagreement] = deque(maxlen=max_disagreements)
+        self.transitions: Counter = Counter()
+        self.rule_pairs: Counter = Counter()
+        self.submitted = 0
+        self.dropped = 0
+        self.agreed = 0
+        self.disagreed = 0
+        self.errors = 0
+
+    def apply(self, message) -> None:
+        with self.lock:
+            if isinstance(message, ShadowDisagreement):
+                self.disagreed += 1
+                self.transitions[(message.active_verdict, message.shadow_verdict)] += 1
+                self.rule_pairs[(message.active_rule_id, message.shadow_rule_id)] += 1
+                self.disagreements.append(message)
+            else:
+                agreed, errors = message
+                self.agreed += agreed
+                self.errors += errors
+
+def _collect(results, state: _ShadowState, stopped: threading.Event) -> None:
+    while not stopped.is_set():
+        try:
+            message = results.get(timeout=0.5)
+        except queue.Empty:
+            continue
+        except (EOFError, OSError):
+            return
+        state.apply(message)
+
+def _ship(pending: Deque[tuple], tasks, state: _ShadowState, stopped: threading.Event) -> None:
+    # Moves samples to the workers in batches, so submit() never pickles or wakes a thread.
+    while not stopped.wait(FLUSH_INTERVAL_S):
+        while pending:
+            batch = []
+            while pending and len(batch) < MAX_BATCH:
+                batch.append(pending.popleft())
+            try:
+                tasks.put_nowait(batch)
+            except (queue.Full, ValueError):
+                with state.lock:
+                    state.dropped += len(batch)
+
+def _shutdown(stopped: threading.Event, pending: Deque[tuple], tasks, processes: List[Any]) -> None:
+    stopped.set()
+    pending.clear()
+    # Terminate rather than drain: pending samples are discarded, never waited on.
+    for p in processes:
+        if p.is_alive():
+            p.terminate()
+    tasks.cancel_join_thread()
+    tasks.close()
+
+class ShadowEvaluator:
+    """Evaluates a candidate bundle in worker processes and records verdict diffs.
+
+    submit() only appends to a bounded in-memory buffer; when it is full, or
+    the workers fall behind, samples are dropped and counted. Workers run in
+    separate processes at idle CPU priority, so they neither hold this
+    interpreter's GIL nor preempt the request path.
+    """
+
+    def __init__(
+        self,
+        bundle: PolicyBundle,
+        workers: int = 2,
+        queue_size: int = 1024,
+        max_disagreements: int = 1000,
+        start_method: str = "spawn"
+    ):
+        self.bundle = bundle
+        self.queue_size = queue_size
+        mp = multiprocessing.get_context(start_method)
+        self._pending: Deque[tuple] = deque()
+        self._tasks = mp.Queue(maxsize=max(1, queue_size // MAX_BATCH) + 1)
+        self._results = mp.Queue()
+        self._stopped = threading.Event()
+        self._state = _ShadowState(max_disagreements)
+        self._processes = [
+            mp.Process(
+                target=_shadow_worker,
+                args=(bundle, self._tasks, self._results),
+                name=f"execlayer-shadow-{i}",
+                daemon=True
+            )
+            for i in range(max(1, workers))
+        ]
+        for p in self._processes:
+            p.start()
+        # Helper threads must not reference self, so a dropped kernel still shuts down.
+        self._threads = [
+            threading.Thread(
+                target=_ship,
+                args=(self._pending, self._tasks, self._state, self._stopped),
+                name="execlayer-shadow-shipper",
+                daemon=True
+            ),
+            threading.Thread(
+                target=_collect,
+                args=(self._results, self._state, self._stopped),
+                name="execlayer-shadow-collector",
+                daemon=True
+            )
+        ]
+        for t in self._threads:
+            t.start()
+        self._finalizer = weakref.finalize(
+            self, _shutdown, self._stopped, self._pending, self._tasks, self._processes
+        )
+
+    def submit(self, ctx, tool_name: str, params: Dict[str, Any], active: Optional[PolicyOutcome]) -> bool:
+        if self._stopped.is_set():
+            return False
+        if len(self._pending) >= self.queue_size:
+            with self._state.lock:
+                self._state.dropped += 1
+            return False
+        active_verdict, active_rule = outcome_verdict(active)
+        self._pending.append((ctx, tool_name, params, active_verdict, active_rule))
+        with self._state.lock:
+            self._state.submitted += 1
+        return True
+
+    def disagreements(self) -> List[ShadowDisagreement]:
+        with self._state.lock:
+            return list(self._state.disagreements)
+
+    def stats(self) -> Dict[str, Any]:
+        s = self._state
+        with s.lock:
+            evaluated = s.agreed + s.disagreed
+            return {
+                "shadow_bundle_id": self.bundle.bundle_id,
+                "shadow_bundle_version": self.bundle.version,
+                "submitted": s.submitted,
+                "dropped": s.dropped,
+                "evaluated": evaluated,
+                "errors": s.errors,
+                "pending": len(self._pending),
+                "agreed": s.agreed,
+                "disagreed": s.disagreed,
+                "disagreement_rate": (s.disagreed / evaluated) if evaluated else 0.0,
+                "transitions": {f"{a}->{b}": n for (a, b), n in s.transitions.items()},
+                "rule_pairs": [
+                    {"active_rule_id": a, "shadow_rule_id": b, "count": n}
+                    for (a, b), n in s.rule_pairs.most_common()
+                ]
+            }
+
+    def close(self, timeout: float = 0.0) -> None:
+        """Stops the workers without waiting for the backlog; pending samples are discarded.
+
+        Joins for at most ``timeout`` seconds per worker (default: not at all).
+        """
+        self._finalizer()
+        if timeout > 0:
+            for p in self._processes:
+                p.join(timeout)
+            for t in self._threads:
+                t.join(timeout)
@@ -0,0 +1,150 @@
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+class StreamLagged(Exception):
+    pass
+
+def entry_fields(wrapped: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    payload = wrapped.get("payload", {})
+    receipt = payload.get("receipt")
+    if receipt is not None:
+        return (
+            payload.get("event"),
+            receipt.get("intercepted", {}).get("tool"),
+            receipt.get("agent", {}).get("agent_id")
+        )
+    return payload.get("event"), payload.get("tool"), payload.get("agent_id")
+
+@dataclass(frozen=True)
+class StreamEntry:
+    """One published audit line plus the fields subscribers filter on."""
+    seq: int
+    entry_hash: str
+    event: Optional[str]
+    tool: Optional[str]
+    agent: Optional[str]
+    line: str
+
+    def matches(
+        self,
+        verdict: Optional[str] = None,
+        tool: Optional[str] = None,
+        agent: Optional[str] = None
+    ) -> bool:
+        if verdict is not None and self.event != verdict:
+            return False
+        if tool is not None and self.tool != tool:
+            return False
+        if agent is not None and self.agent != agent:
+            return False
+        return True
+
+class DecisionStream:
+    """In-process ring buffer of audit entries for live subscribers.
+
+    publish() is O(1) plus one wake-up per subscriber and never waits on a
+    consumer or parses JSON: the ring keeps the serialized line and the filter
+    fields. It holds at most ``capacity`` entries and ``max_bytes`` of lines
+    (measured as string length).
+    Subscribers read by sequence cursor; one that falls behind the oldest
+    retained entry gets StreamLagged and must reconnect.
+    """
+
+    def __init__(self, capacity: int = 4096, max_bytes: int = 64 * 1024 * 1024):
+        self._lock = threading.Lock()
+        self._ring: Deque[StreamEntry] = deque()
+        self._index: Dict[str, int] = {}
+        self._capacity = max(1, capacity)
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._next_seq = 0
+        self._wakers: Set[Callable[[], None]] = set()
+
+    def publish(self, wrapped: Dict[str, Any], line: str) -> None:
+        """Adds one entry; ``line`` must be the serialized form of ``wrapped``."""
+        event, tool, agent = entry_fields(wrapped)
+        with self._lock:
+            item = StreamEntry(self._next_seq, wrapped["entry_hash"], event, tool, agent, line)
+            self._ring.append(item)
+            self._index[item.entry_hash] = item.seq
+            self._bytes += len(line)
+            self._next_seq += 1
+            # Always keep the newest entry, even if it alone exceeds max_bytes.
+            while len(self._ring) > 1 and (len(self._ring) > self._capacity or self._bytes > self._max_bytes):
+                evicted = self._ring.popleft()
+                self._bytes -= len(evicted.line)
+                self._index.pop(evicted.entry_hash, None)
+            wakers = list(self._wakers)
+        for wake in wakers:
+            wake()
+
+    def head(self) -> int:
+        with self._lock:
+            return self._next_seq
+
+    def cursor_after(self, entry_hash: str) -> Optional[int]:
+        with self._lock:
+            seq = self._index.get(entry_hash)
+        return None if seq is None else seq + 1
+
+    def read(self, cursor: int, limit: int = 256) -> Tuple[List[StreamEntry], int]:
+        with self._lock:
+            oldest = self._ring[0].seq if self._ring else self._next_seq
+            if cursor < oldest:
+                raise StreamLagged(f"cursor {cursor} evicted; oldest retained is {oldest}")
+            start = cursor - oldest
+            items = list(islice(self._ring, start, start + limit))
+        return items, cursor + len(items)
+
+    def add_waker(self, wake: Callable[[], None]) -> None:
+        with self._lock:
+            self._wakers.add(wake)
+
+    def remove_waker(self, wake: Callable[[], None]) -> None:
+        with self._lock:
+            self._wakers.discard(wake)
+
+    async def subscribe(
+        self,
+        cursor: Optional[int] = None,
+        verdict: Optional[str] = None,
+        tool: Optional[str] = None,
+        agent: Optional[str] = None,
+        heartbeat_s: Optional[float] = None
+    ) -> AsyncIterator[Optional[StreamEntry]]:
+        """Yields matching entries from ``cursor`` (default: live head) onward.
+
+        Yields None every ``heartbeat_s`` seconds of silence so transports can
+        send keep-alives.
+        """
+        loop = asyncio.get_running_loop()
+        ready = asyncio.Event()
+
+        def wake() -> None:
+            try:
+                loop.call_soon_threadsafe(ready.set)
+            except RuntimeError:
+                pass
+
+        if cursor is None:
+            cursor = self.head()
+        self.add_waker(wake)
+        try:
+            while True:
+                ready.clear()
+                items, cursor = self.read(cursor)
+                for item in items:
+                    if item.matches(verdict, tool, agent):
+                        yield item
+                if items:
+                    continue
+                try:
+                    await asyncio.wait_for(ready.wait(), heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield None
+        finally:
+            self.remove_waker(wake)
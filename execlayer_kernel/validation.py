@@ -1,4 +1,5 @@
 from typing import Any, Dict
+from .blobstore import BLOB_REF_KEY, contains_blob_ref
 from .schemas import TOOL_REGISTRY
 
 class ValidationError(Exception):
@@ -26,3 +27,5 @@ def validate_tool_call(tool_call: Dict[str, Any]) -> None:
     for key in params.keys():
         if key not in schema.allowed_params:
             raise ValidationError(f"Disallowed parameter: {key}")
+        if contains_blob_ref(params[key]):
+            raise ValidationError(f"Parameter {key} carries reserved key {BLOB_REF_KEY}")
@@ -0,0 +1,66 @@
+import os
+import sys
+
+import pytest
+
+# Make api/ and execlayer_kernel importable when running plain `pytest`
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from execlayer_kernel.constants import DataClass
+from execlayer_kernel.context import Actor, ExecutionContext, Intent
+from execlayer_kernel.kernel import ExecLayerKernel
+from execlayer_kernel.policy_bundle import PolicyBundle
+from execlayer_kernel.rules import RuleBlockSelfPromptRewrite, RuleBlockSlackSecretScrape
+
+BLOCK_PROMPT_EDIT = {"function": "edit_system_prompt", "parameters": {"new_prompt": "x"}}
+
+
+def make_ctx(agent_id: str = "agent", session_id: str = "s") -> ExecutionContext:
+    return ExecutionContext(
+        actor=Actor(id="u", display="U", org_unit="o", role="r"),
+        agent_id=agent_id,
+        session_id=session_id,
+        intent=Intent(statement="i", purpose="p", business_process="b"),
+        environment="test",
+        jurisdiction="US",
+        data_class=DataClass.INTERNAL,
+        attributes={},
+    )
+
+
+@pytest.fixture
+def ctx() -> ExecutionContext:
+    return make_ctx()
+
+
+@pytest.fixture
+def bundle() -> PolicyBundle:
+    return PolicyBundle(
+        bundle_id="bundle_test",
+        version="1",
+        rules=[
+            RuleBlockSelfPromptRewrite(rule_id="R1", priority=100, description="Block self constraint edits"),
+            RuleBlockSlackSecretScrape(rule_id="R2", priority=90, description="Block credential harvesting"),
+        ],
+    )
+
+
+@pytest.fixture
+def audit_path(tmp_path) -> str:
+    return str(tmp_path / "audit.jsonl")
+
+
+@pytest.fixture
+def make_kernel(bundle, audit_path):
+    kernels = []
+
+    def factory(**kwargs) -> ExecLayerKernel:
+        kwargs.setdefault("policy_bundle", bundle)
+        kwargs.setdefault("audit_log_path", audit_path)
+        kernel = ExecLayerKernel(**kwargs)
+        kernels.append(kernel)
+        return kernel
+
+    yield factory
+    for kernel in kernels:
+        kernel.disable_shadow()
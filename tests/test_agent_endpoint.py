@@ -0,0 +1,145 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import AsyncOpenAI
+
+from api import index
+
+
+class StandInOpenAI:
+    """Local stand-in for the chat completions API that counts backend calls."""
+
+    def __init__(self, delay_s: float = 0.0):
+        self.delay_s = delay_s
+        self.calls = 0
+        self.lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                body = json.loads(self.rfile.read(length))
+                with stand_in.lock:
+                    stand_in.calls += 1
+                    n = stand_in.calls
+                time.sleep(stand_in.delay_s)
+                payload = json.dumps({
+                    "id": f"chatcmpl-{n}",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": body["model"],
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": f" answer #{n} "},
+                    }],
+                }).encode()
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/v1"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    with StandInOpenAI(delay_s=0.2) as server:
+        monkeypatch.setenv("OPENAI_BASE_URL", server.base_url)
+        # Fresh client, semaphore and cache per test: each test runs its own event loop.
+        monkeypatch.setattr(index, "client", AsyncOpenAI(api_key="test-key"))
+        monkeypatch.setattr(index, "agent_slots", asyncio.Semaphore(4))
+        monkeypatch.setattr(index, "agent_cache", index.AgentResponseCache(ttl_s=60, max_entries=16))
+        yield server
+
+
+def ask(question, context=None):
+    return index.exec_layer_agent(index.AgentRequest(question=question, context=context))
+
+
+def test_cache_hit_after_normalization(stand_in):
+    async def run():
+        first = await ask("What controls  apply to PII?", "EU  bank")
+        second = await ask("  what CONTROLS apply to pii? ", "eu bank")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first.answer == "answer #1"
+    assert second.answer == "answer #1"
+    assert stand_in.calls == 1
+
+
+def test_ttl_expiry(stand_in, monkeypatch):
+    monkeypatch.setattr(index, "agent_cache", index.AgentResponseCache(ttl_s=0.3, max_entries=16))
+
+    async def run():
+        await ask("q")
+        await ask("q")
+        await asyncio.sleep(0.4)
+        return await ask("q")
+
+    third = asyncio.run(run())
+    assert third.answer == "answer #2"
+    assert stand_in.calls == 2
+
+
+def test_lru_eviction_at_max_entries(stand_in, monkeypatch):
+    monkeypatch.setattr(index, "agent_cache", index.AgentResponseCache(ttl_s=60, max_entries=2))
+
+    async def run():
+        await ask("a")
+        await ask("b")
+        await ask("a")  # refreshes "a", leaving "b" least recently used
+        await ask("c")  # evicts "b"
+        assert stand_in.calls == 3
+        await ask("a")
+        assert stand_in.calls == 3
+        await ask("b")
+        assert stand_in.calls == 4
+
+    asyncio.run(run())
+
+
+def test_concurrent_identical_requests_share_one_call(stand_in):
+    async def run():
+        return await asyncio.gather(*[ask("Same question?") for _ in range(10)])
+
+    answers = asyncio.run(run())
+    assert {a.answer for a in answers} == {"answer #1"}
+    assert stand_in.calls == 1
+
+
+def test_cancelled_caller_does_not_cancel_shared_call(stand_in):
+    async def run():
+        first = asyncio.create_task(ask("Shared?"))
+        second = asyncio.create_task(ask("shared?"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        answer = await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        cached = await ask("SHARED?")
+        return answer, cached
+
+    answer, cached = asyncio.run(run())
+    assert answer.answer == "answer #1"
+    assert cached.answer == "answer #1"
+    assert stand_in.calls == 1
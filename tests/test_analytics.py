@@ -0,0 +1,136 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from conftest import BLOCK_PROMPT_EDIT, make_ctx
+from execlayer_kernel.analytics import COLUMNS, ReceiptColumns, export_columns
+
+SLACK_READ = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "standup"}}
+
+
+@pytest.fixture
+def out_dir(tmp_path):
+    return str(tmp_path / "columns")
+
+
+def _column_sizes(out_dir):
+    return {name: os.path.getsize(os.path.join(out_dir, f"{name}.bin")) for name in COLUMNS}
+
+
+def test_incremental_export_appends_only_new_entries(make_kernel, audit_path, out_dir):
+    kernel = make_kernel()
+    kernel.intercept(make_ctx(agent_id="a1"), SLACK_READ)
+    kernel.intercept(make_ctx(agent_id="a1"), BLOCK_PROMPT_EDIT)
+    first = export_columns(audit_path, out_dir)
+    assert first["rows"] == 2
+    assert first["offset"] == os.path.getsize(audit_path)
+
+    kernel.intercept(make_ctx(agent_id="a2"), BLOCK_PROMPT_EDIT)
+    second = export_columns(audit_path, out_dir)
+    assert second["rows"] == 3
+    assert export_columns(audit_path, out_dir)["rows"] == 3
+
+    cols = ReceiptColumns(out_dir)
+    assert cols.verdict_counts("agent_id") == {"a1": {"ALLOW": 1, "BLOCK": 1}, "a2": {"BLOCK": 1}}
+    assert cols.verdict_counts("tool") == {
+        "read_slack_history": {"ALLOW": 1},
+        "edit_system_prompt": {"BLOCK": 2},
+    }
+    report = cols.report()
+    assert report["rows"] == 3
+    assert report["malformed"] == 0
+    assert report["risk_score"]["count"] == 2
+    assert set(report["latency_ms"]) == {"p50", "p90", "p99"}
+
+
+def test_torn_trailing_line_is_left_for_next_run(make_kernel, audit_path, out_dir):
+    kernel = make_kernel()
+    kernel.intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    complete = os.path.getsize(audit_path)
+    with open(audit_path, "a") as f:
+        f.write('{"payload": {"event": "AL')
+
+    manifest = export_columns(audit_path, out_dir)
+    assert manifest["rows"] == 1
+    assert manifest["offset"] == complete
+    assert manifest["malformed"] == 0
+
+
+def test_malformed_lines_are_skipped_and_counted(make_kernel, audit_path, out_dir):
+    kernel = make_kernel()
+    kernel.intercept(make_ctx(), SLACK_READ)
+    with open(audit_path, "a") as f:
+        f.write("{not json\n")
+        f.write("[1, 2]\n")
+    kernel.intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+
+    manifest = export_columns(audit_path, out_dir)
+    assert manifest["rows"] == 2
+    assert manifest["malformed"] == 2
+    assert manifest["offset"] == os.path.getsize(audit_path)
+
+    kernel.intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    manifest = export_columns(audit_path, out_dir)
+    assert manifest["rows"] == 3
+    assert manifest["malformed"] == 2
+    assert ReceiptColumns(out_dir).report()["malformed"] == 2
+
+
+def test_kernel_restart_starts_a_new_chain(make_kernel, audit_path, out_dir):
+    make_kernel().intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    export_columns(audit_path, out_dir)
+    make_kernel().intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    assert export_columns(audit_path, out_dir)["rows"] == 2
+
+
+def test_chain_break_is_rejected(make_kernel, audit_path, out_dir):
+    kernel = make_kernel()
+    kernel.intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    export_columns(audit_path, out_dir)
+    kernel.intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+
+    with open(audit_path) as f:
+        lines = f.readlines()
+    forged = json.loads(lines[1])
+    forged["prev_entry_hash"] = "sha256:" + "0" * 64
+    lines[1] = json.dumps(forged) + "\n"
+    with open(audit_path, "w") as f:
+        f.writelines(lines)
+
+    with pytest.raises(ValueError, match="chain break"):
+        export_columns(audit_path, out_dir)
+
+
+def test_uncommitted_column_bytes_are_dropped(make_kernel, audit_path, out_dir):
+    kernel = make_kernel()
+    kernel.intercept(make_ctx(agent_id="a1"), BLOCK_PROMPT_EDIT)
+    export_columns(audit_path, out_dir)
+    committed = _column_sizes(out_dir)
+
+    # Simulate a crash after a flush but before the manifest was replaced.
+    for name in COLUMNS:
+        with open(os.path.join(out_dir, f"{name}.bin"), "ab") as f:
+            f.write(b"\xff" * 24)
+    assert export_columns(audit_path, out_dir)["rows"] == 1
+    assert _column_sizes(out_dir) == committed
+
+    kernel.intercept(make_ctx(agent_id="a2"), BLOCK_PROMPT_EDIT)
+    export_columns(audit_path, out_dir)
+    cols = ReceiptColumns(out_dir)
+    assert np.asarray(cols.columns["agent_id"]).tolist() == [0, 1]
+
+
+def test_export_rejects_other_source_and_truncated_log(make_kernel, audit_path, out_dir, tmp_path):
+    make_kernel().intercept(make_ctx(), BLOCK_PROMPT_EDIT)
+    export_columns(audit_path, out_dir)
+
+    other = tmp_path / "other.jsonl"
+    other.write_text("")
+    with pytest.raises(ValueError, match="exported from"):
+        export_columns(str(other), out_dir)
+
+    open(audit_path, "w").close()
+    with pytest.raises(ValueError, match="truncated"):
+        export_columns(audit_path, out_dir)
@@ -0,0 +1,98 @@
+import pytest
+
+from execlayer_kernel.blobstore import BLOB_REF_KEY, FORGED_REF_PLACEHOLDER, BlobStore
+from execlayer_kernel.replay import replay_audit_log
+from execlayer_kernel.validation import ValidationError, validate_tool_call
+
+
+def _blob_files(root):
+    return [p for p in root.rglob("*") if p.is_file()]
+
+
+def test_allow_without_replay_capture_writes_no_blob(tmp_path, make_kernel, ctx):
+    blobs = tmp_path / "blobs"
+    kernel = make_kernel(blob_store=BlobStore(str(blobs), 10))
+    kernel.intercept(ctx, {"function": "read_slack_history", "parameters": {"channel": "c", "search": "x" * 100}})
+    assert _blob_files(blobs) == []
+
+
+def test_blocked_call_references_blob(tmp_path, make_kernel, ctx):
+    blobs = tmp_path / "blobs"
+    kernel = make_kernel(blob_store=BlobStore(str(blobs), 10))
+    receipt = kernel.intercept(ctx, {"function": "edit_system_prompt", "parameters": {"new_prompt": "p" * 100}})
+    ref = receipt["intercepted"]["parameters"]["new_prompt"]
+    assert ref["bytes"] == 100
+    assert len(_blob_files(blobs)) == 1
+
+
+def test_replay_counts_unresolved_blobs(tmp_path, make_kernel, bundle, audit_path, ctx):
+    blobs = tmp_path / "blobs"
+    kernel = make_kernel(blob_store=BlobStore(str(blobs), 10), capture_replay=True)
+    kernel.intercept(ctx, {"function": "read_slack_history", "parameters": {"channel": "c", "search": "api_key" * 10}})
+
+    unresolved = replay_audit_log(audit_path, bundle, workers=1)
+    assert unresolved["unresolved_blob"] == 1
+    assert unresolved["replayed"] == 0
+    assert unresolved["errors"] == 0
+
+    missing = tmp_path / "missing"
+    replay_audit_log(audit_path, bundle, workers=1, blob_dir=str(missing))
+    assert not missing.exists()
+
+    resolved = replay_audit_log(audit_path, bundle, workers=1, blob_dir=str(blobs))
+    assert resolved["replayed"] == 1
+    assert resolved["agreed"] == 1
+
+
+@pytest.mark.parametrize("digest", [
+    "sha256:../../secret.txt",
+    "sha256:" + "0" * 63,
+    "sha256:" + "A" * 64,
+    "md5:" + "0" * 64,
+    "/dev/zero",
+    None,
+])
+def test_path_for_rejects_malformed_digests(tmp_path, digest):
+    store = BlobStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.path_for(digest)
+    with pytest.raises(ValueError):
+        store.get({BLOB_REF_KEY: digest})
+
+
+def test_validation_rejects_reserved_key_at_any_depth():
+    forged = {BLOB_REF_KEY: "sha256:" + "0" * 64}
+    for value in (forged, {"nested": forged}, [forged]):
+        with pytest.raises(ValidationError):
+            validate_tool_call({"function": "edit_system_prompt", "parameters": {"new_prompt": value}})
+
+
+def test_externalize_rejects_incoming_refs(tmp_path):
+    store = BlobStore(str(tmp_path), 10)
+    with pytest.raises(ValueError):
+        store.externalize({"new_prompt": {BLOB_REF_KEY: "sha256:../../secret.txt"}})
+
+
+def test_forged_ref_never_reaches_receipt_or_log(tmp_path, make_kernel, audit_path, ctx):
+    kernel = make_kernel(blob_store=BlobStore(str(tmp_path / "blobs"), 64), capture_replay=True)
+    forged = {BLOB_REF_KEY: "sha256:../../secret.txt", "bytes": 1}
+    receipt = kernel.intercept(ctx, {"function": "edit_system_prompt", "parameters": {"new_prompt": forged}})
+
+    assert receipt["verdict"]["status"] == "ERROR"
+    assert receipt["intercepted"]["parameters"] == {"new_prompt": FORGED_REF_PLACEHOLDER}
+    assert "crypto" not in receipt
+    with open(audit_path, "a+") as f:
+        f.seek(0)
+        assert BLOB_REF_KEY not in f.read()
+
+
+def test_caller_dict_named_blob_ref_is_plain_data(tmp_path, make_kernel, bundle, audit_path, ctx):
+    # The old unprefixed key is ordinary caller data, never resolved as a reference.
+    kernel = make_kernel(blob_store=BlobStore(str(tmp_path / "blobs"), 10), capture_replay=True)
+    params = {"new_prompt": "x", "reason": {"blob_ref": "sha256:../../secret.txt"}}
+    receipt = kernel.intercept(ctx, {"function": "edit_system_prompt", "parameters": params})
+    assert receipt["intercepted"]["parameters"] == params
+
+    report = replay_audit_log(audit_path, bundle, workers=1, blob_dir=str(tmp_path / "blobs"))
+    assert report["unresolved_blob"] == 0
+    assert report["agreed"] == 1
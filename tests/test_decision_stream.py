@@ -0,0 +1,135 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from api import index
+from conftest import BLOCK_PROMPT_EDIT, make_ctx
+from execlayer_kernel.crypto import canonical_json, sha256_hex
+from execlayer_kernel.stream import DecisionStream, StreamLagged
+
+SLACK_READ = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "standup"}}
+
+
+def _request(headers=None):
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/stream/decisions", "query_string": b"", "headers": raw})
+
+
+def test_streamed_entries_match_payload_hash(make_kernel, ctx):
+    stream = DecisionStream(capacity=16)
+    kernel = make_kernel(decision_stream=stream)
+
+    receipt = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    assert "audit" in receipt
+
+    (streamed,), _ = stream.read(0)
+    wrapped = json.loads(streamed.line)
+    assert streamed.entry_hash == wrapped["entry_hash"] == receipt["audit"]["entry_hash"]
+    assert "audit" not in wrapped["payload"]["receipt"]
+    assert wrapped["payload_hash"] == f"sha256:{sha256_hex(canonical_json(wrapped['payload']))}"
+
+
+def test_filters_by_verdict_tool_and_agent(make_kernel):
+    stream = DecisionStream(capacity=16)
+    kernel = make_kernel(decision_stream=stream)
+    kernel.intercept(make_ctx(agent_id="a1"), SLACK_READ)
+    kernel.intercept(make_ctx(agent_id="a2"), SLACK_READ)
+    kernel.intercept(make_ctx(agent_id="a1"), BLOCK_PROMPT_EDIT)
+
+    items, cursor = stream.read(0)
+    assert cursor == 3
+    assert [(i.event, i.tool, i.agent) for i in items] == [
+        ("ALLOW", "read_slack_history", "a1"),
+        ("ALLOW", "read_slack_history", "a2"),
+        ("BLOCK", "edit_system_prompt", "a1"),
+    ]
+    assert [i.seq for i in items if i.matches(verdict="ALLOW")] == [0, 1]
+    assert [i.seq for i in items if i.matches(tool="edit_system_prompt")] == [2]
+    assert [i.seq for i in items if i.matches(agent="a1")] == [0, 2]
+    assert [i.seq for i in items if i.matches(verdict="ALLOW", agent="a1")] == [0]
+
+
+def test_cursor_after_resumes_past_entry(make_kernel, ctx):
+    stream = DecisionStream(capacity=16)
+    kernel = make_kernel(decision_stream=stream)
+    first = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    second = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+
+    cursor = stream.cursor_after(first["audit"]["entry_hash"])
+    (item,), _ = stream.read(cursor)
+    assert item.entry_hash == second["audit"]["entry_hash"]
+    assert stream.cursor_after("sha256:unknown") is None
+
+
+def test_ring_is_bounded_by_bytes(make_kernel, ctx):
+    stream = DecisionStream(capacity=1000, max_bytes=1)
+    kernel = make_kernel(decision_stream=stream)
+    first = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    second = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+
+    # Only the newest entry survives, even though it alone exceeds the bound.
+    assert stream.cursor_after(first["audit"]["entry_hash"]) is None
+    (item,), _ = stream.read(1)
+    assert item.entry_hash == second["audit"]["entry_hash"]
+
+
+def test_slow_consumer_gets_stream_lagged(make_kernel, ctx):
+    stream = DecisionStream(capacity=2)
+    kernel = make_kernel(decision_stream=stream)
+
+    async def run():
+        subscriber = stream.subscribe(cursor=0)
+        for _ in range(3):
+            kernel.intercept(ctx, SLACK_READ)
+        with pytest.raises(StreamLagged):
+            await subscriber.__anext__()
+
+    asyncio.run(run())
+    with pytest.raises(StreamLagged):
+        stream.read(0)
+
+
+def test_sse_rejects_evicted_cursor_with_410(make_kernel, ctx, monkeypatch):
+    stream = DecisionStream(capacity=1)
+    monkeypatch.setattr(index, "decision_stream", stream)
+    kernel = make_kernel(decision_stream=stream)
+    evicted = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(index.stream_decisions(_request(), after=evicted["audit"]["entry_hash"]))
+    assert exc.value.status_code == 410
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(index.stream_decisions(_request({"Last-Event-ID": evicted["audit"]["entry_hash"]})))
+    assert exc.value.status_code == 410
+
+
+def test_sse_frames_carry_event_id_and_audit_line(make_kernel, monkeypatch):
+    stream = DecisionStream(capacity=16)
+    monkeypatch.setattr(index, "decision_stream", stream)
+    kernel = make_kernel(decision_stream=stream)
+    first = kernel.intercept(make_ctx(agent_id="a1"), BLOCK_PROMPT_EDIT)
+    kernel.intercept(make_ctx(agent_id="a1"), SLACK_READ)
+    blocked = kernel.intercept(make_ctx(agent_id="a2"), BLOCK_PROMPT_EDIT)
+
+    async def run():
+        response = await index.stream_decisions(
+            _request({"Last-Event-ID": first["audit"]["entry_hash"]}), verdict="block"
+        )
+        assert response.media_type == "text/event-stream"
+        frames = response.body_iterator
+        try:
+            return await asyncio.wait_for(frames.__anext__(), 1.0)
+        finally:
+            await frames.aclose()
+
+    frame = asyncio.run(run())
+    event, event_id, data, blank = frame.split("\n", 3)
+    assert event == "event: BLOCK"
+    assert event_id == f"id: {blocked['audit']['entry_hash']}"
+    assert json.loads(data[len("data: "):])["payload"]["receipt"]["agent"]["agent_id"] == "a2"
+    assert blank == "\n"
@@ -0,0 +1,106 @@
+import json
+from collections import Counter
+
+import pytest
+
+from conftest import BLOCK_PROMPT_EDIT, make_ctx
+from execlayer_kernel.replay import (
+    MAX_CHUNK_BYTES,
+    MIN_CHUNK_BYTES,
+    ReplayReport,
+    _auto_chunk_bytes,
+    _chunk_ranges,
+    _iter_lines,
+    replay_audit_log,
+)
+
+SLACK_SCRAPE = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "api_key"}}
+SLACK_READ = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "standup"}}
+
+
+@pytest.fixture
+def lines_file(tmp_path):
+    # Uneven line lengths, including a multi-byte character, so boundaries land mid-line.
+    lines = [f'{{"n": {i}, "pad": "{"é" * (i % 7)}{"x" * (i * 3 % 11)}"}}\n'.encode() for i in range(50)]
+    path = tmp_path / "lines.jsonl"
+    path.write_bytes(b"".join(lines))
+    return str(path), lines
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 2, 7, 13, 64, 100, 1 << 20])
+def test_chunks_yield_every_line_exactly_once(lines_file, chunk_bytes):
+    path, lines = lines_file
+    size = sum(len(line) for line in lines)
+    seen = [line for start, end in _chunk_ranges(size, chunk_bytes) for line in _iter_lines(path, start, end)]
+    assert seen == lines
+
+
+def test_iter_lines_yields_trailing_line_without_newline(tmp_path):
+    path = tmp_path / "torn.jsonl"
+    path.write_bytes(b"a\nbb\nccc")
+    assert list(_iter_lines(str(path), 0, 8)) == [b"a\n", b"bb\n", b"ccc"]
+    assert list(_iter_lines(str(path), 2, 8)) == [b"bb\n", b"ccc"]
+    assert list(_iter_lines(str(path), 3, 8)) == [b"ccc"]
+
+
+def test_auto_chunk_bytes_spreads_small_logs_across_workers():
+    assert _auto_chunk_bytes(8 * MIN_CHUNK_BYTES, 4) == 2 * MIN_CHUNK_BYTES
+    assert _auto_chunk_bytes(10, 4) == MIN_CHUNK_BYTES
+    assert _auto_chunk_bytes(1 << 40, 4) == MAX_CHUNK_BYTES
+
+
+def test_report_merge_sums_counts_and_caps_samples():
+    left = ReplayReport(entries=2, replayed=2, disagreed=2, max_samples=3)
+    left.transitions[("ALLOW", "BLOCK")] = 2
+    left.samples = [{"n": 0}, {"n": 1}]
+    right = ReplayReport(entries=3, replayed=2, agreed=1, disagreed=1, malformed=1)
+    right.transitions[("ALLOW", "BLOCK")] = 1
+    right.rule_pairs[(None, "R2")] = 1
+    right.samples = [{"n": 2}, {"n": 3}]
+
+    merged = left.merge(right).to_dict()
+    assert merged["entries"] == 5
+    assert merged["replayed"] == 4
+    assert merged["malformed"] == 1
+    assert merged["disagreement_rate"] == 0.75
+    assert merged["transitions"] == {"ALLOW->BLOCK": 3}
+    assert merged["samples"] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+def test_receipt_replay_capture_stores_only_attributes(make_kernel, audit_path, bundle):
+    kernel = make_kernel(capture_replay=True)
+    ctx = make_ctx()
+    ctx.attributes["tenant"] = "t1"
+    kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+
+    with open(audit_path) as f:
+        payload = json.loads(f.readline())["payload"]
+    assert list(payload["replay"]) == ["attributes"]
+    assert payload["replay"]["attributes"]["tenant"] == "t1"
+    assert "parameters" not in json.dumps(payload["replay"])
+
+    report = replay_audit_log(audit_path, bundle, workers=1)
+    assert report["replayed"] == 1
+    assert report["agreed"] == 1
+
+
+def test_parallel_replay_matches_serial(make_kernel, audit_path, bundle):
+    kernel = make_kernel(capture_replay=True)
+    for i in range(60):
+        call = (SLACK_READ, SLACK_SCRAPE, BLOCK_PROMPT_EDIT)[i % 3]
+        kernel.intercept(make_ctx(agent_id=f"agent-{i % 4}", session_id=f"s{i}"), call)
+    with open(audit_path, "a") as f:
+        f.write("{not json\n")
+
+    # The candidate drops R2, so every recorded credential scrape flips to ALLOW.
+    candidate = type(bundle)(bundle_id="candidate", version="2", rules=bundle.rules[:1])
+    serial = replay_audit_log(audit_path, candidate, workers=1, chunk_bytes=512)
+    parallel = replay_audit_log(audit_path, candidate, workers=3, chunk_bytes=512)
+
+    assert serial["entries"] == 61
+    assert serial["malformed"] == 1
+    assert serial["disagreed"] == 20
+    assert serial["transitions"] == {"BLOCK->ALLOW": 20}
+    for key in ("entries", "replayed", "malformed", "agreed", "disagreed", "transitions", "rule_pairs"):
+        assert parallel[key] == serial[key]
+    assert Counter(s["session_id"] for s in parallel["samples"]) == Counter(s["session_id"] for s in serial["samples"])
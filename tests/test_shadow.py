@@ -0,0 +1,112 @@
+import gc
+import time
+
+from conftest import make_ctx
+from execlayer_kernel.kernel import ExecLayerKernel
+from execlayer_kernel.policy_bundle import PolicyBundle, PolicyRule
+from execlayer_kernel.rules import RuleBlockSelfPromptRewrite, RuleBlockSlackSecretScrape
+from execlayer_kernel.shadow import ShadowEvaluator
+
+SECRET_SEARCH = {"function": "read_slack_history", "parameters": {"channel": "c", "search": "api_key"}}
+
+
+class RuleSpin(PolicyRule):
+    def evaluate(self, ctx, tool_name, params):
+        total = 0
+        for i in range(200000):
+            total += i
+        return None
+
+
+ACTIVE = PolicyBundle(
+    bundle_id="active", version="1", rules=[RuleBlockSelfPromptRewrite(rule_id="R1", priority=100, description="")]
+)
+CANDIDATE = PolicyBundle(
+    bundle_id="candidate", version="2", rules=[RuleBlockSlackSecretScrape(rule_id="R2", priority=90, description="")]
+)
+SPIN = PolicyBundle(bundle_id="spin", version="2", rules=[RuleSpin(rule_id="R-SPIN", priority=1, description="")])
+
+
+def wait_for(predicate, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def test_disagreements_and_stats(make_kernel, ctx):
+    kernel = make_kernel(policy_bundle=ACTIVE, shadow_bundle=CANDIDATE)
+    for _ in range(3):
+        kernel.intercept(ctx, SECRET_SEARCH)
+        kernel.intercept(ctx, {"function": "read_slack_history", "parameters": {"channel": "c"}})
+
+    assert wait_for(lambda: kernel.shadow_stats()["evaluated"] == 6)
+    stats = kernel.shadow_stats()
+    assert stats["submitted"] == 6
+    assert stats["dropped"] == 0
+    assert stats["agreed"] == 3
+    assert stats["disagreed"] == 3
+    assert stats["disagreement_rate"] == 0.5
+    assert stats["transitions"] == {"ALLOW->BLOCK": 3}
+    assert stats["rule_pairs"] == [{"active_rule_id": None, "shadow_rule_id": "R2", "count": 3}]
+
+    (first, *_) = kernel.shadow.disagreements()
+    assert (first.tool, first.active_rule_id, first.shadow_rule_id) == ("read_slack_history", None, "R2")
+
+
+def test_submit_drops_when_buffer_is_full(ctx):
+    shadow = ShadowEvaluator(SPIN, workers=1, queue_size=5)
+    try:
+        accepted = [shadow.submit(ctx, "read_slack_history", {}, None) for _ in range(20)]
+        assert accepted.count(True) == 5
+        stats = shadow.stats()
+        assert (stats["submitted"], stats["dropped"]) == (5, 15)
+    finally:
+        shadow.close()
+
+
+def test_close_discards_backlog_without_waiting(ctx):
+    shadow = ShadowEvaluator(SPIN, workers=1, queue_size=10000)
+    for _ in range(5000):
+        shadow.submit(ctx, "read_slack_history", {}, None)
+
+    start = time.perf_counter()
+    shadow.close()
+    assert time.perf_counter() - start < 0.1
+    assert shadow.submit(ctx, "read_slack_history", {}, None) is False
+
+    shadow.close(timeout=5)
+    assert not any(p.is_alive() for p in shadow._processes)
+
+
+def test_dropped_kernel_stops_its_workers(bundle, audit_path):
+    kernel = ExecLayerKernel(bundle, audit_path, shadow_bundle=SPIN)
+    processes = list(kernel.shadow._processes)
+    del kernel
+    gc.collect()
+    assert wait_for(lambda: not any(p.is_alive() for p in processes), timeout=5)
+
+
+def _p99(kernel, ctx, n=2000):
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        kernel.intercept(ctx, SECRET_SEARCH)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[int(n * 0.99) - 1]
+
+
+def test_cpu_bound_shadow_does_not_move_active_p99(make_kernel):
+    ctx = make_ctx()
+    baseline = _p99(make_kernel(policy_bundle=ACTIVE), ctx)
+
+    kernel = make_kernel(policy_bundle=ACTIVE, shadow_bundle=SPIN)
+    assert wait_for(lambda: all(p.is_alive() for p in kernel.shadow._processes))
+    time.sleep(0.5)
+    with_shadow = _p99(kernel, ctx)
+
+    # Thread-based workers pushed this to ~the 5 ms GIL switch interval.
+    assert with_shadow < baseline * 3 + 0.0005
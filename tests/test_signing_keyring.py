@@ -0,0 +1,68 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from api import index
+from conftest import BLOCK_PROMPT_EDIT
+from execlayer_kernel.crypto import verify_receipts
+
+ADMIN = {"Authorization": "Bearer admin-token"}
+
+
+@pytest.fixture
+def admin_api(make_kernel, monkeypatch):
+    kernel = make_kernel(signing_secret=b"s1", signing_key_id="k1")
+    monkeypatch.setattr(index, "kernel", kernel)
+    monkeypatch.setattr(index, "ADMIN_TOKEN", "admin-token")
+    return TestClient(index.app), kernel
+
+
+def test_rotate_and_retire_through_kernel(make_kernel, ctx):
+    kernel = make_kernel(signing_secret=b"s1", signing_key_id="k1")
+    assert not hasattr(kernel, "signing_secret")
+
+    old = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    kernel.rotate_signing_key("k2", b"s2")
+    new = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    assert (old["crypto"]["kid"], new["crypto"]["kid"]) == ("k1", "k2")
+    assert verify_receipts([old, new], kernel.keyring)["verified"] == 2
+
+    with pytest.raises(ValueError):
+        kernel.retire_signing_key("k2")
+    kernel.retire_signing_key("k1")
+    result = verify_receipts([old, new], kernel.keyring)
+    assert result["verified"] == 1
+    assert result["unknown_kid"] == [old["receipt_id"]]
+
+
+def test_admin_rotation_changes_signing_key_at_runtime(admin_api, ctx):
+    client, kernel = admin_api
+    old = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+
+    response = client.post("/admin/signing-keys/rotate", json={"kid": "k2", "secret": "s2"}, headers=ADMIN)
+    assert response.status_code == 200
+    assert response.json() == {"active_kid": "k2", "kids": ["k1", "k2"]}
+    assert "s2" not in response.text
+
+    new = kernel.intercept(ctx, BLOCK_PROMPT_EDIT)
+    assert new["crypto"]["kid"] == "k2"
+    assert verify_receipts([old, new], kernel.keyring)["verified"] == 2
+
+    duplicate = client.post("/admin/signing-keys/rotate", json={"kid": "k2", "secret": "x"}, headers=ADMIN)
+    assert duplicate.status_code == 409
+    assert client.post("/admin/signing-keys/retire", json={"kid": "k2"}, headers=ADMIN).status_code == 409
+
+    retired = client.post("/admin/signing-keys/retire", json={"kid": "k1"}, headers=ADMIN)
+    assert retired.json() == {"active_kid": "k2", "kids": ["k2"]}
+    assert client.get("/admin/signing-keys", headers=ADMIN).json()["kids"] == ["k2"]
+
+
+def test_admin_routes_require_token(admin_api, monkeypatch):
+    client, kernel = admin_api
+    body = {"kid": "k2", "secret": "s2"}
+    assert client.post("/admin/signing-keys/rotate", json=body).status_code == 401
+    assert client.post("/admin/signing-keys/rotate", json=body, headers={"Authorization": "Bearer nope"}).status_code == 401
+    assert kernel.keyring.kids() == ["k1"]
+
+    monkeypatch.setattr(index, "ADMIN_TOKEN", None)
+    assert client.post("/admin/signing-keys/rotate", json=body, headers=ADMIN).status_code == 404
+    assert client.get("/admin/signing-keys", headers=ADMIN).status_code == 404